@@ -1,6 +1,7 @@
 """Advent of Code - Day 1."""
+import heapq
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_1.txt"
 
@@ -38,9 +39,51 @@ def find_elves_most_calories(calories: List, n: int) -> int:
     return sum([cal for _, cal in cals[:n]])
 
 
+def stream_elves_most_calories(calories: Iterable[str], ns: Iterable[int]) -> Dict:
+    """Streaming fat elf detection.
+
+    Single pass over the calorie lines with a running sum for the current elf.
+    Only the largest max(ns) totals are kept in a min-heap, so memory does not
+    depend on the size of the input.
+
+    Args:
+        calories: Iterable of calorie lines, e.g. an open file object.
+        ns: Thresholds for top n elves by calories.
+
+    Returns:
+        Dict: Total calories for top n elves, keyed by n.
+    """
+    ns = list(ns)
+    k = max(ns, default=0)
+    top: List[int] = []
+
+    def push(total: int) -> None:
+        if len(top) < k:
+            heapq.heappush(top, total)
+        elif k and total > top[0]:
+            heapq.heapreplace(top, total)
+
+    current = 0
+    has_items = False
+    for line in calories:
+        line = line.strip()
+        if line == "":
+            if has_items:
+                push(current)
+            current, has_items = 0, False
+        else:
+            current += int(line)
+            has_items = True
+    if has_items:
+        push(current)
+
+    ranked = sorted(top, reverse=True)
+    return {n: sum(ranked[:n]) for n in ns}
+
+
 if __name__ == "__main__":
     with open(FILE_PATH, "r") as file:
-        calories = [line.strip() for line in file.readlines()]
+        totals = stream_elves_most_calories(file, ns=[1, 3])
 
-    print(f"Part 1: {find_elves_most_calories(calories, n=1)}.")
-    print(f"Part 2: {find_elves_most_calories(calories, n=3)}.")
+    print(f"Part 1: {totals[1]}.")
+    print(f"Part 2: {totals[3]}.")
@@ -1,6 +1,9 @@
 """Advent of Code - Day 10."""
 
+from array import array
+from bisect import bisect_right
 from pathlib import Path
+from typing import Iterable, Iterator
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_10.txt"
 
@@ -74,10 +77,196 @@ def draw_pixels(signals: list) -> str:
     return "\n".join(["".join(pixels[(i * 40) : ((i + 1) * 40)]) for i in range(6)])
 
 
+def run_cpu(signals: Iterable) -> Iterator[tuple[int, int]]:
+    """CPU emulator.
+
+    Args:
+        signals: Signals sent by CPU, e.g. split lines of an open file.
+
+    Yields:
+        tuple[int, int]: Cycle number and value of the X register during the
+            cycle.
+
+    Raises:
+        ValueError: If signal does not match 'noop' or 'addx V'.
+    """
+    cycle = 0
+    x = 1
+    for signal in signals:
+        match signal:
+            case ["noop"]:
+                cycle += 1
+                yield cycle, x
+            case ["addx", register]:
+                yield cycle + 1, x
+                yield cycle + 2, x
+                cycle += 2
+                x += int(register)
+            case _:
+                raise ValueError("Invalid signal.")
+
+
+class SignalSampler:
+    """Observer collecting signal strengths at given cycles."""
+
+    def __init__(self, cycles: Iterable[int]):
+        """Initialize sampler.
+
+        Args:
+            cycles: Cycle numbers.
+        """
+        self.cycles = set(cycles)
+        self.strengths: dict[int, int] = {}
+
+    def observe(self, cycle: int, x: int) -> None:
+        """Sample the signal strength.
+
+        Args:
+            cycle: Cycle number.
+            x: Value of the X register during the cycle.
+        """
+        if cycle in self.cycles:
+            self.strengths[cycle] = cycle * x
+
+
+class CrtRenderer:
+    """Observer drawing the CRT image."""
+
+    def __init__(self, width: int = 40, height: int = 6):
+        """Initialize screen.
+
+        Args:
+            width: Pixels per row.
+            height: Number of rows.
+        """
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(b"." * (width * height))
+
+    def observe(self, cycle: int, x: int) -> None:
+        """Draw the pixel of the cycle if the sprite covers it.
+
+        Args:
+            cycle: Cycle number.
+            x: Value of the X register during the cycle.
+        """
+        pos = cycle - 1
+        if pos < len(self.pixels) and -1 <= pos % self.width - x <= 1:
+            self.pixels[pos] = ord("#")
+
+    def render(self) -> str:
+        """CRT image.
+
+        Returns:
+            str: Pixels to print.
+        """
+        image = self.pixels.decode()
+        return "\n".join(
+            image[(i * self.width) : ((i + 1) * self.width)] for i in range(self.height)
+        )
+
+
+def run_observers(signals: Iterable, observers: Iterable) -> None:
+    """Feed every cycle of the CPU to the observers in one pass.
+
+    Args:
+        signals: Signals sent by CPU, e.g. split lines of an open file.
+        observers: Objects with an observe(cycle, x) method.
+    """
+    callbacks = [observer.observe for observer in observers]
+    for cycle, x in run_cpu(signals):
+        for callback in callbacks:
+            callback(cycle, x)
+
+
+class RegisterTimeline:
+    """X register values stored only at the cycles where they change."""
+
+    def __init__(self, signals: Iterable):
+        """Compile the timeline.
+
+        Args:
+            signals: Signals sent by CPU, e.g. split lines of an open file.
+
+        Raises:
+            ValueError: If signal does not match 'noop' or 'addx V'.
+        """
+        # values[k] is the X register from cycle starts[k] on
+        self.starts = array("q", [1])
+        self.values = array("q", [1])
+        self.n_cycles = 0
+        for signal in signals:
+            match signal:
+                case ["noop"]:
+                    self.n_cycles += 1
+                case ["addx", register]:
+                    self.n_cycles += 2
+                    if int(register) != 0:
+                        self.starts.append(self.n_cycles + 1)
+                        self.values.append(self.values[-1] + int(register))
+                case _:
+                    raise ValueError("Invalid signal.")
+
+    def value_at(self, cycle: int) -> int:
+        """X register during a cycle.
+
+        Args:
+            cycle: Cycle number.
+
+        Returns:
+            int: Value of the X register.
+
+        Raises:
+            ValueError: If cycle is smaller than 1.
+        """
+        if cycle < 1:
+            raise ValueError("Cycles start at 1.")
+
+        return self.values[bisect_right(self.starts, cycle) - 1]
+
+    def values_at(self, cycles: list[int]) -> list[int]:
+        """X register during a batch of cycles.
+
+        The cycles are sorted once and merged with the change points, so the
+        batch costs O(q log q + k) for q cycles and k changes.
+
+        Args:
+            cycles: Cycle numbers.
+
+        Returns:
+            list[int]: Values of the X register, in the order of cycles.
+
+        Raises:
+            ValueError: If a cycle is smaller than 1.
+        """
+        if any(cycle < 1 for cycle in cycles):
+            raise ValueError("Cycles start at 1.")
+
+        values = [0] * len(cycles)
+        k = 0
+        for i in sorted(range(len(cycles)), key=cycles.__getitem__):
+            while k + 1 < len(self.starts) and self.starts[k + 1] <= cycles[i]:
+                k += 1
+            values[i] = self.values[k]
+
+        return values
+
+    def signal_strengths(self, cycles: list[int]) -> list[int]:
+        """Signal strengths.
+
+        Args:
+            cycles: Cycle numbers.
+
+        Returns:
+            list: Register values multiplied by cycle numbers.
+        """
+        return [x * i for x, i in zip(self.values_at(cycles), cycles)]
+
+
 if __name__ == "__main__":
+    sampler = SignalSampler(cycles=[20, 60, 100, 140, 180, 220])
+    crt = CrtRenderer()
     with open(FILE_PATH, "r") as file:
-        signals = [line.strip().split() for line in file.readlines()]
-    print(
-        f"Part 1: {sum(compute_signal_strength(signals, cycles=[20, 60, 100, 140, 180, 220]))}."
-    )
-    print(f"Part 2:\n{draw_pixels(signals)}")
+        run_observers((line.split() for line in file), [sampler, crt])
+    print(f"Part 1: {sum(sampler.strengths.values())}.")
+    print(f"Part 2:\n{crt.render()}")
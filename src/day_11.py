@@ -1,8 +1,11 @@
 """Advent of Code - Day 11."""
 
+import os
 import re
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce
+from itertools import repeat
 from math import lcm
 from pathlib import Path
 
@@ -114,11 +117,302 @@ def track_monkeys(notes: list, n_rounds: int, worry_drop: bool) -> list[int]:
     return counts
 
 
+ADD, MUL, SQUARE = range(3)
+
+
+class Monkey:
+    """Monkey with a compiled operation."""
+
+    __slots__ = ("items", "opcode", "operand", "divisible_by", "if_true", "if_false")
+
+    def __init__(
+        self,
+        items: list[int],
+        opcode: int,
+        operand: int,
+        divisible_by: int,
+        if_true: int,
+        if_false: int,
+    ):
+        """Initialize monkey.
+
+        Args:
+            items: Worry levels of the items.
+            opcode: ADD, MUL or SQUARE.
+            operand: Integer operand of the operation, unused for SQUARE.
+            divisible_by: Integer for the division check.
+            if_true: Monkey to pass the item to if the check passes.
+            if_false: Monkey to pass the item to otherwise.
+        """
+        self.items = items
+        self.opcode = opcode
+        self.operand = operand
+        self.divisible_by = divisible_by
+        self.if_true = if_true
+        self.if_false = if_false
+
+
+def compile_operation(operation: str) -> tuple[int, int]:
+    """Compile operation.
+
+    Args:
+        operation: Right-hand side of the operation, e.g. 'old * 19'.
+
+    Returns:
+        tuple[int, int]: Opcode and operand.
+
+    Raises:
+        ValueError: If the operation is not an addition or multiplication of
+            old with an integer or itself.
+    """
+    match operation.split():
+        case ["old", "*", "old"]:
+            return SQUARE, 0
+        case ["old", "+", "old"]:
+            return MUL, 2
+        case ["old", "*", operand] if operand.isdigit():
+            return MUL, int(operand)
+        case ["old", "+", operand] if operand.isdigit():
+            return ADD, int(operand)
+
+    raise ValueError(f"Invalid operation: {operation}.")
+
+
+def compile_monkeys(notes: list[str]) -> list[Monkey]:
+    """Parse monkeys without eval.
+
+    Args:
+        notes: Raw puzzle input.
+
+    Returns:
+        list[Monkey]: List of monkeys.
+    """
+    monkeys = []
+    r = re.compile(r"\d+")
+
+    for monkey in fmt_puzzle_input(notes):
+        items = [int(item) for item in re.findall(r, monkey[0])]
+        opcode, operand = compile_operation(monkey[1].removeprefix("Operation: new ="))
+        divisible_by = int(*re.findall(r, monkey[2]))
+        if_true = int(*re.findall(r, monkey[3]))
+        if_false = int(*re.findall(r, monkey[4]))
+        monkeys.append(Monkey(items, opcode, operand, divisible_by, if_true, if_false))
+
+    return monkeys
+
+
+def track_compiled_monkeys(notes: list, n_rounds: int, worry_drop: bool) -> list[int]:
+    """Count items with compiled monkeys.
+
+    Same as track_monkeys, but with the operations compiled to opcodes and each
+    monkey's items handed over as a whole list per turn.
+
+    Args:
+        notes: Raw puzzle input.
+        n_rounds: Number of rounds.
+        worry_drop: Boolean indicating if worry levels should be divided by 3
+                    after item inspection by a monkey.
+
+    Returns:
+        list[int]: Item counts for each monkey.
+    """
+    monkeys = compile_monkeys(notes)
+    limiter = lcm(*[monkey.divisible_by for monkey in monkeys])
+
+    counts = [0 for _ in range(len(monkeys))]
+    for _ in range(n_rounds):
+        for i, monkey in enumerate(monkeys):
+            items, monkey.items = monkey.items, []
+            counts[i] += len(items)
+            operand, divisible_by = monkey.operand, monkey.divisible_by
+            to_true = monkeys[monkey.if_true].items.append
+            to_false = monkeys[monkey.if_false].items.append
+            # one loop per opcode keeps the dispatch out of the item loop
+            if monkey.opcode == ADD:
+                for item in items:
+                    item += operand
+                    item = item // 3 if worry_drop else item % limiter
+                    (to_false if item % divisible_by else to_true)(item)
+            elif monkey.opcode == MUL:
+                for item in items:
+                    item *= operand
+                    item = item // 3 if worry_drop else item % limiter
+                    (to_false if item % divisible_by else to_true)(item)
+            else:
+                for item in items:
+                    item *= item
+                    item = item // 3 if worry_drop else item % limiter
+                    (to_false if item % divisible_by else to_true)(item)
+
+    return counts
+
+
+def _track_item(
+    monkeys: list[Monkey], limiter: int, monkey: int, item: int, n_rounds: int
+) -> list[int]:
+    """Inspection counts of a single item.
+
+    Follow the item from round to round. Its state at the start of a round is
+    the monkey holding it and its worry level modulo limiter, so the sequence
+    of states eventually repeats. Once it does, the counts of the remaining
+    rounds follow from the counts of the cycle.
+
+    Args:
+        monkeys: Compiled monkeys.
+        limiter: LCM of all monkey dividers.
+        monkey: Monkey holding the item at the start.
+        item: Worry level of the item at the start.
+        n_rounds: Number of rounds.
+
+    Returns:
+        list[int]: Inspections of the item by each monkey.
+    """
+    counts = [0 for _ in range(len(monkeys))]
+    seen: dict[tuple[int, int], int] = {}
+    history: list[list[int]] = []  # inspecting monkeys per round
+
+    state = (monkey, item)
+    for n in range(n_rounds):
+        if state in seen:
+            break
+        seen[state] = n
+        inspected = []
+        while True:
+            current = monkeys[monkey]
+            inspected.append(monkey)
+            if current.opcode == ADD:
+                item += current.operand
+            elif current.opcode == MUL:
+                item *= current.operand
+            else:
+                item *= item
+            item %= limiter
+            if item % current.divisible_by:
+                to_monkey = current.if_false
+            else:
+                to_monkey = current.if_true
+            # monkeys later in the round inspect the item again in this round
+            if to_monkey <= monkey:
+                monkey = to_monkey
+                break
+            monkey = to_monkey
+        history.append(inspected)
+        for i in inspected:
+            counts[i] += 1
+        state = (monkey, item)
+    else:
+        return counts
+
+    start = seen[state]
+    cycle = history[start:]
+    n_cycles, rest = divmod(n_rounds - len(history), len(cycle))
+    for n, inspected in enumerate(cycle):
+        for i in inspected:
+            counts[i] += n_cycles + (n < rest)
+
+    return counts
+
+
+def track_items_cyclic(notes: list, n_rounds: int) -> list[int]:
+    """Count items with cycle detection.
+
+    Same as track_monkeys without worry drop. Items never interact, so each is
+    tracked on its own and fast-forwarded once its state repeats. The run time
+    is bounded by the cycle lengths instead of n_rounds.
+
+    Args:
+        notes: Raw puzzle input.
+        n_rounds: Number of rounds.
+
+    Returns:
+        list[int]: Item counts for each monkey.
+    """
+    monkeys = compile_monkeys(notes)
+    limiter = lcm(*[monkey.divisible_by for monkey in monkeys])
+
+    counts = [0 for _ in range(len(monkeys))]
+    for i, monkey in enumerate(monkeys):
+        for item in monkey.items:
+            item_counts = _track_item(monkeys, limiter, i, item, n_rounds)
+            counts = [x + y for x, y in zip(counts, item_counts)]
+
+    return counts
+
+
+_worker_state: dict = {}
+
+
+def _init_worker(monkeys: list[Monkey], limiter: int) -> None:
+    """Keep the monkeys in the worker process.
+
+    Args:
+        monkeys: Compiled monkeys.
+        limiter: LCM of all monkey dividers.
+    """
+    _worker_state["monkeys"] = monkeys
+    _worker_state["limiter"] = limiter
+
+
+def _track_items(items: list[tuple[int, int]], n_rounds: int) -> list[int]:
+    """Inspection counts of a share of the items in a worker process.
+
+    Args:
+        items: Pairs of the monkey holding the item and its worry level.
+        n_rounds: Number of rounds.
+
+    Returns:
+        list[int]: Summed inspections by each monkey.
+    """
+    monkeys = _worker_state["monkeys"]
+    limiter = _worker_state["limiter"]
+
+    counts = [0 for _ in range(len(monkeys))]
+    for monkey, item in items:
+        item_counts = _track_item(monkeys, limiter, monkey, item, n_rounds)
+        counts = [x + y for x, y in zip(counts, item_counts)]
+
+    return counts
+
+
+def track_items_parallel(
+    notes: list, n_rounds: int, max_workers: int | None = None
+) -> list[int]:
+    """Count items in parallel.
+
+    Same as track_items_cyclic with the items split across a process pool. The
+    monkeys are sent once to each worker and the counts of all shares are
+    summed at the end.
+
+    Args:
+        notes: Raw puzzle input.
+        n_rounds: Number of rounds.
+        max_workers: Number of worker processes.
+
+    Returns:
+        list[int]: Item counts for each monkey.
+    """
+    monkeys = compile_monkeys(notes)
+    limiter = lcm(*[monkey.divisible_by for monkey in monkeys])
+    items = [(i, item) for i, monkey in enumerate(monkeys) for item in monkey.items]
+
+    n_shares = 4 * (max_workers or os.cpu_count() or 1)
+    shares = [items[k::n_shares] for k in range(n_shares) if items[k::n_shares]]
+
+    counts = [0 for _ in range(len(monkeys))]
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(monkeys, limiter)
+    ) as pool:
+        for share_counts in pool.map(_track_items, shares, repeat(n_rounds)):
+            counts = [x + y for x, y in zip(counts, share_counts)]
+
+    return counts
+
+
 if __name__ == "__main__":
     with open(FILE_PATH, "r") as file:
         notes = [line.strip() for line in file.readlines()]
-    counts_part_1 = track_monkeys(notes, n_rounds=20, worry_drop=True)
-    counts_part_2 = track_monkeys(notes, n_rounds=10_000, worry_drop=False)
+    counts_part_1 = track_compiled_monkeys(notes, n_rounds=20, worry_drop=True)
+    counts_part_2 = track_items_cyclic(notes, n_rounds=10_000)
     print(
         f"Part 1: {reduce(lambda x, y: x*y, sorted(counts_part_1, reverse=True)[:2])}"
     )
@@ -1,6 +1,9 @@
 """Advent of Code - Day 12."""
 
+import heapq
 import string
+from array import array
+from collections import Counter, OrderedDict, deque
 from pathlib import Path
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_12.txt"
@@ -176,9 +179,212 @@ def find_path(heatmap: list, low_elevation: bool) -> list:
     return opt_paths
 
 
+def find_distances(heatmap: list) -> tuple[dict, dict]:
+    """Distances to the end.
+
+    Single BFS backwards from the end point. A step from current to next is
+    allowed if next is at most one higher, so going backwards a neighbor is
+    reachable if it is at most one lower. The graph is built once.
+
+    Args:
+        heatmap: Formatted puzzle input.
+
+    Returns:
+        tuple[dict, dict]: Number of steps to the end and the next point on a
+            shortest path for every point that can reach the end.
+    """
+    heights: dict[tuple[int, int], int] = {
+        (i, j): _get_value(val)
+        for i, row in enumerate(heatmap)
+        for j, val in enumerate(row)
+    }
+    # predecessors: points from which a point can be reached in one step
+    graph: dict[tuple[int, int], list[tuple[int, int]]] = {
+        (i, j): [
+            neighbor
+            for neighbor in [(i - 1, j), (i + 1, j), (i, j + 1), (i, j - 1)]
+            if neighbor in heights and height - heights[neighbor] <= 1
+        ]
+        for (i, j), height in heights.items()
+    }
+
+    [(i_end, j_end)] = _get_coordinates(heatmap, "E")
+    end_point = (i_end, j_end)
+    distances: dict[tuple[int, int], int] = {end_point: 0}
+    next_points: dict[tuple[int, int], tuple[int, int] | None] = {end_point: None}
+    queue = deque([end_point])
+
+    while queue:
+        current_point = queue.popleft()
+        for neighbor in graph[current_point]:
+            if neighbor not in distances:
+                distances[neighbor] = distances[current_point] + 1
+                next_points[neighbor] = current_point
+                queue.append(neighbor)
+
+    return distances, next_points
+
+
+def build_path(next_points: dict, start_point: tuple) -> list:
+    """Path from a starting point.
+
+    Args:
+        next_points: Next points from find_distances.
+        start_point: Starting point.
+
+    Returns:
+        list: Points on the path without the end point, as in find_path.
+    """
+    path = []
+    point = start_point
+    while next_points[point] is not None:
+        path.append(point)
+        point = next_points[point]
+
+    return path
+
+
+class Heightmap:
+    """Precompiled heightmap for repeated shortest path queries.
+
+    Heights are kept in a flat bytearray with a border of walls, so the four
+    neighbors of a point are fixed offsets in the array. Points are given as
+    (row, column) tuples.
+    """
+
+    WALL = 255
+    _translation = bytes.maketrans(
+        b"SE" + string.ascii_lowercase.encode(), bytes([0, 25, *range(26)])
+    )
+
+    def __init__(self, heatmap: list, max_fields: int = 16, field_after: int = 2):
+        """Initialize heightmap.
+
+        Args:
+            heatmap: Formatted puzzle input.
+            max_fields: Number of distance fields kept in the LRU cache.
+            field_after: Number of queries to the same end point after which its
+                         complete distance field is computed and cached.
+        """
+        self.n_rows = len(heatmap)
+        self.n_cols = len(heatmap[0])
+        self.width = self.n_cols + 2
+        self.offsets = (-self.width, self.width, 1, -1)
+
+        self.heights = bytearray([self.WALL]) * (self.width * (self.n_rows + 2))
+        for i, row in enumerate(heatmap):
+            start = self._index((i, 0))
+            line = "".join(row).encode()
+            self.heights[start : (start + self.n_cols)] = line.translate(
+                self._translation
+            )
+
+        self.max_fields = max_fields
+        self.field_after = field_after
+        self._fields: OrderedDict[int, array] = OrderedDict()
+        self._queries: Counter = Counter()
+
+    def _index(self, point: tuple) -> int:
+        return (point[0] + 1) * self.width + point[1] + 1
+
+    def distance_field(self, dst: tuple) -> array:
+        """Distances to an end point.
+
+        BFS backwards from the end point over the whole map. Fields are kept in
+        an LRU cache.
+
+        Args:
+            dst: End point.
+
+        Returns:
+            array: Number of steps to the end point for each padded index, -1
+                if the end point can't be reached.
+        """
+        target = self._index(dst)
+        if target in self._fields:
+            self._fields.move_to_end(target)
+            return self._fields[target]
+
+        heights = self.heights
+        field = array("i", [-1]) * len(heights)
+        field[target] = 0
+        queue = deque([target])
+        while queue:
+            current = queue.popleft()
+            for offset in self.offsets:
+                neighbor = current + offset
+                if (
+                    field[neighbor] == -1
+                    and heights[neighbor] != self.WALL
+                    and heights[current] - heights[neighbor] <= 1
+                ):
+                    field[neighbor] = field[current] + 1
+                    queue.append(neighbor)
+
+        self._fields[target] = field
+        if len(self._fields) > self.max_fields:
+            self._fields.popitem(last=False)
+
+        return field
+
+    def distance(self, src: tuple, dst: tuple) -> int | None:
+        """Shortest path length.
+
+        Look the distance up in the cached field of the end point. Otherwise
+        use A* with the Manhattan distance as heuristic, and compute the field
+        once the end point has been queried field_after times.
+
+        Args:
+            src: Starting point.
+            dst: End point.
+
+        Returns:
+            int | None: Number of steps, None if dst can't be reached.
+        """
+        target = self._index(dst)
+        self._queries[target] += 1
+        if target in self._fields or self._queries[target] >= self.field_after:
+            steps = self.distance_field(dst)[self._index(src)]
+            return steps if steps >= 0 else None
+
+        return self._astar(self._index(src), target)
+
+    def _astar(self, source: int, target: int) -> int | None:
+        heights = self.heights
+        target_row, target_col = divmod(target, self.width)
+
+        def _heuristic(index: int) -> int:
+            row, col = divmod(index, self.width)
+            return abs(row - target_row) + abs(col - target_col)
+
+        steps = {source: 0}
+        queue = [(_heuristic(source), 0, source)]
+        while queue:
+            _, g, current = heapq.heappop(queue)
+            if current == target:
+                return g
+            if g > steps[current]:
+                continue
+            for offset in self.offsets:
+                neighbor = current + offset
+                if (
+                    heights[neighbor] != self.WALL
+                    and heights[neighbor] - heights[current] <= 1
+                    and g + 1 < steps.get(neighbor, g + 2)
+                ):
+                    steps[neighbor] = g + 1
+                    priority = g + 1 + _heuristic(neighbor)
+                    heapq.heappush(queue, (priority, g + 1, neighbor))
+
+        return None
+
+
 if __name__ == "__main__":
     with open(FILE_PATH, "r") as file:
         lines = [line.strip() for line in file.readlines()]
     heatmap = [[e for e in line] for line in lines]
-    print(f"Part 1: {len(find_path(heatmap, low_elevation=False)[0])}.")
-    print(f"Part 2: {min([len(p) for p in find_path(heatmap, low_elevation=True)])}.")
+    distances, _ = find_distances(heatmap)
+    starting_points = _get_coordinates(heatmap, "S") + _get_coordinates(heatmap, "a")
+    [start_point] = _get_coordinates(heatmap, "S")
+    print(f"Part 1: {distances[start_point]}.")
+    print(f"Part 2: {min(distances[p] for p in starting_points if p in distances)}.")
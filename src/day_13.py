@@ -1,8 +1,10 @@
 """Advent of Code - Day 13."""
 
-from functools import reduce
+import re
+from functools import cmp_to_key, reduce
 from itertools import zip_longest
 from pathlib import Path
+from typing import Iterable, Iterator
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_13.txt"
 
@@ -30,6 +32,99 @@ def parse_packets(lines: list[str]) -> list:
     return [[eval(p[0]), eval(p[1])] for p in signals]
 
 
+_token = re.compile(rb"\d+|.", re.DOTALL)
+
+
+def _tokenize(data: bytes) -> Iterator[bytes]:
+    """Tokenizer.
+
+    Args:
+        data: Packet as bytes.
+
+    Yields:
+        bytes: Brackets, commas and integers of the packet.
+
+    Raises:
+        ValueError: If the packet contains any other character.
+    """
+    for match in _token.finditer(data):
+        token = match.group()
+        if token not in (b"[", b"]", b",") and not token.isdigit():
+            raise ValueError(f"Invalid character in packet: {token!r}.")
+        yield token
+
+
+def parse_packet(line: str | bytes) -> list:
+    """Packet parser.
+
+    Single pass over the tokens of a packet with a stack of open lists.
+
+    Args:
+        line: Packet as str or bytes.
+
+    Returns:
+        list: Nested lists of integers.
+
+    Raises:
+        ValueError: If the packet is not a single well-formed list.
+    """
+    data = line.encode() if isinstance(line, str) else line
+    stack: list[list] = []
+    packet = None
+    # a value is expected after "[" and ",", a separator after values and "]"
+    expect_value = True
+    for token in _tokenize(data):
+        if packet is not None:
+            raise ValueError("Content after the end of the packet.")
+        if token == b",":
+            if expect_value:
+                raise ValueError("Unexpected comma in packet.")
+            expect_value = True
+        elif token == b"]":
+            if not stack or (expect_value and stack[-1]):
+                raise ValueError("Unexpected closing bracket in packet.")
+            current = stack.pop()
+            if stack:
+                stack[-1].append(current)
+            else:
+                packet = current
+            expect_value = False
+        elif not expect_value or (not stack and token != b"["):
+            raise ValueError("Missing comma or opening bracket in packet.")
+        elif token == b"[":
+            stack.append([])
+        else:
+            stack[-1].append(int(token))
+            expect_value = False
+
+    if packet is None:
+        raise ValueError("Unbalanced packet.")
+
+    return packet
+
+
+def iter_packet_pairs(lines: Iterable) -> Iterator[list]:
+    """Streaming pairs.
+
+    Parse pairs of packets line by line, skipping blank lines.
+
+    Args:
+        lines: Puzzle input as str or bytes lines, e.g. an open file object.
+
+    Yields:
+        list: Pair of packets for comparison.
+    """
+    pair = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        pair.append(parse_packet(line))
+        if len(pair) == 2:
+            yield pair
+            pair = []
+
+
 def compare_packet(left: int | list, right: int | list) -> int:
     """Comparison.
 
@@ -89,17 +184,168 @@ def compute_decoder_key(packets: list) -> int:
     return reduce(lambda x, y: x * y, divider_indices)
 
 
+def _depth(packet: int | list) -> int:
+    """Nesting depth.
+
+    Args:
+        packet: Packet or item of a packet.
+
+    Returns:
+        int: Nesting depth of lists, 0 for an integer.
+    """
+    if isinstance(packet, int):
+        return 0
+    return 1 + max((_depth(p) for p in packet), default=0)
+
+
+def packet_key(packet: int | list, depth: int) -> int | tuple:
+    """Sort key.
+
+    An integer compares like a list holding only that integer. Wrapping every
+    integer until all of them sit at the same depth therefore keeps the order,
+    and integers are then only compared with integers and lists with lists,
+    which is exactly how Python compares nested tuples.
+
+    Args:
+        packet: Packet or item of a packet.
+        depth: Depth at which all integers are placed, larger than the nesting
+               depth of all packets to be compared.
+
+    Returns:
+        int | tuple: Nested tuples, directly comparable with other keys of the
+            same depth.
+    """
+    if isinstance(packet, int):
+        key: int | tuple = packet
+        for _ in range(depth):
+            key = (key,)
+        return key
+
+    return tuple(packet_key(p, depth - 1) for p in packet)
+
+
+def _reverse_compare(left: int | list, right: int | list) -> int:
+    """Comparator.
+
+    Args:
+        left: Left packet.
+        right: Right packet.
+
+    Returns:
+        int: Negative if left sorts before right, as expected by cmp_to_key.
+    """
+    return -compare_packet(left, right)
+
+
+def sort_packets(packets: list, use_key: bool = True) -> list:
+    """Sort packets.
+
+    Args:
+        packets: Flat list of packets.
+        use_key: Sort with packet_key, else with compare_packet as comparator.
+
+    Returns:
+        list: Packets in the right order.
+    """
+    if not use_key:
+        return sorted(packets, key=cmp_to_key(_reverse_compare))
+
+    depth = max((_depth(p) for p in packets), default=0) + 1
+    return sorted(packets, key=lambda p: packet_key(p, depth))
+
+
+def compute_decoder_key_fast(packets: list) -> int:
+    """Decoder key without sorting.
+
+    The position of a divider packet is one plus the number of packets before
+    it, so only two comparisons per packet are needed. As in
+    compute_decoder_key, packets equal to a divider are placed before it.
+
+    Args:
+        packets: List of pairs for comparison.
+
+    Returns:
+        int: Decoder key.
+    """
+    before_2 = 0
+    before_6 = 0
+    for packet in packets:
+        for p in packet:
+            before_2 += compare_packet(p, [[2]]) >= 0
+            before_6 += compare_packet(p, [[6]]) >= 0
+
+    # [[2]] is before [[6]]
+    return (before_2 + 1) * (before_6 + 2)
+
+
+def compare_raw(left: str | bytes, right: str | bytes) -> int:
+    """Lazy comparison.
+
+    Compare two packets token by token straight from their raw strings. An
+    integer compared with a list is promoted by pushing back the tokens of a
+    one-element list, so no lists are built, and the scan stops at the first
+    deciding token.
+
+    Args:
+        left: Left packet as str or bytes.
+        right: Right packet as str or bytes.
+
+    Returns:
+        int: Order indicator as in compare_packet.
+
+    Raises:
+        ValueError: If the tokens read up to the decision are not well-formed.
+    """
+    left_data = left.encode() if isinstance(left, str) else left
+    right_data = right.encode() if isinstance(right, str) else right
+    left_tokens = (t for t in _tokenize(left_data) if t != b",")
+    right_tokens = (t for t in _tokenize(right_data) if t != b",")
+    # tokens pushed back by promotions, last one is next
+    left_pending: list[bytes] = []
+    right_pending: list[bytes] = []
+    depth = 0
+
+    while True:
+        # b"" marks the end of a packet
+        l_ = left_pending.pop() if left_pending else next(left_tokens, b"")
+        r_ = right_pending.pop() if right_pending else next(right_tokens, b"")
+        if not l_ or not r_ or (depth == 0 and (l_ != b"[" or r_ != b"[")):
+            raise ValueError("Malformed packet.")
+        if l_ == r_ and l_ in (b"[", b"]"):
+            depth += 1 if l_ == b"[" else -1
+            if depth == 0:
+                # equal packets, nothing may follow
+                if next(left_tokens, b"") or next(right_tokens, b""):
+                    raise ValueError("Content after the end of the packet.")
+                return 0
+            continue
+        if l_ == b"]":
+            return 1
+        if r_ == b"]":
+            return -1
+        if l_ == b"[":
+            # right integer as a one-element list, its "[" matches l_
+            right_pending.extend([b"]", r_])
+            depth += 1
+        elif r_ == b"[":
+            left_pending.extend([b"]", l_])
+            depth += 1
+        elif diff := int(r_) - int(l_):
+            return diff
+
+
 if __name__ == "__main__":
-    with open(FILE_PATH, "r") as file:
-        lines = [line.strip() for line in file.readlines()]
-    packets = parse_packets(lines)
+    with open(FILE_PATH, "rb") as file:
+        lines = [line.strip() for line in file if line.strip()]
+    raw_pairs = list(zip(lines[::2], lines[1::2]))
     sum_of_indices = sum(
         [
             i
-            for i, packet in enumerate(packets, 1)
-            if compare_packet(packet[0], packet[1]) > 0
+            for i, (left, right) in enumerate(raw_pairs, 1)
+            if compare_raw(left, right) > 0
         ]
     )
+    packets = [[parse_packet(left), parse_packet(right)] for left, right in raw_pairs]
     print(f"Part 1: {sum_of_indices}.")
-    decoder_key = compute_decoder_key(packets)
+    decoder_key = compute_decoder_key_fast(packets)
     print(f"Part 2: {decoder_key}.")
@@ -1,7 +1,9 @@
 """Advent of Code - Day 2."""
 from __future__ import annotations
-from typing import List
+
+from collections import Counter
 from pathlib import Path
+from typing import BinaryIO, Dict, List
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_2.txt"
 
@@ -114,9 +116,130 @@ def compute_total_score(strategy: List, type: str) -> int:
     return points
 
 
+def _build_score_table(type: str) -> List[int]:
+    """Score lookup table.
+
+    Score every (opponent, own) combination once with the reference
+    implementation. The score of a round is found at index
+    3 * (opponent - ord('A')) + (own - ord('X')).
+
+    Args:
+        type: Type of instruction, see compute_total_score.
+
+    Returns:
+        List[int]: Flat 3x3 score table.
+    """
+    return [
+        compute_total_score([[opponent, own]], type)
+        for opponent in "ABC"
+        for own in "XYZ"
+    ]
+
+
+SCORE_TABLES: Dict[str, List[int]] = {
+    type: _build_score_table(type) for type in ("move", "result")
+}
+_WHITESPACE = b" \t\r\n"
+
+
+def _strategy_codes(data: bytes) -> bytes:
+    """Strategy codes.
+
+    Strip all whitespace from the raw strategy guide and check that what is
+    left is a sequence of (opponent, own) code pairs.
+
+    Args:
+        data: Raw bytes of complete strategy lines.
+
+    Returns:
+        bytes: Opponent and own codes, alternating.
+
+    Raises:
+        ValueError: If a round is incomplete or contains an unknown code.
+    """
+    codes = data.translate(None, _WHITESPACE)
+    if (
+        len(codes) % 2
+        or codes[0::2].translate(None, b"ABC")
+        or codes[1::2].translate(None, b"XYZ")
+    ):
+        raise ValueError("Strategy guide contains malformed rounds")
+
+    return codes
+
+
+def score_batch(batch: bytes, type: str) -> int:
+    """Batch score.
+
+    Score a batch of complete rounds straight from the raw bytes of the
+    strategy guide by counting (opponent, own) byte pairs and weighting them
+    with the precomputed table.
+
+    Args:
+        batch: Raw bytes of complete strategy lines.
+        type: Type of instruction, see compute_total_score.
+
+    Returns:
+        int: Total score of the batch.
+    """
+    table = SCORE_TABLES[type]
+    codes = _strategy_codes(batch)
+    pairs = Counter(zip(codes[0::2], codes[1::2]))
+    return sum(
+        count * table[3 * (opponent - 65) + (own - 88)]
+        for (opponent, own), count in pairs.items()
+    )
+
+
+def score_strategy_file(file: BinaryIO, type: str, chunk_size: int = 1 << 20) -> int:
+    """Streaming total score.
+
+    Read the strategy guide in chunks of whole lines and score each chunk with
+    score_batch.
+
+    Args:
+        file: Strategy guide opened in binary mode.
+        type: Type of instruction, see compute_total_score.
+        chunk_size: Number of bytes to read per batch.
+
+    Returns:
+        int: Total score.
+    """
+    points = 0
+    rest = b""
+    while chunk := file.read(chunk_size):
+        chunk = rest + chunk
+        split = chunk.rfind(b"\n") + 1
+        rest = chunk[split:]
+        points += score_batch(chunk[:split], type)
+
+    return points + score_batch(rest, type)
+
+
+def score_strategy_numpy(data: bytes, type: str) -> int:
+    """Vectorized total score.
+
+    Score all rounds in one call with NumPy by indexing the score table with
+    the byte codes of every round.
+
+    Args:
+        data: Raw bytes of the strategy guide.
+        type: Type of instruction, see compute_total_score.
+
+    Returns:
+        int: Total score.
+    """
+    import numpy as np
+
+    codes = np.frombuffer(_strategy_codes(data), dtype=np.uint8)
+    codes = codes.reshape(-1, 2).astype(np.intp)
+    table = np.array(SCORE_TABLES[type], dtype=np.int64)
+    return int(table[3 * (codes[:, 0] - 65) + (codes[:, 1] - 88)].sum())
+
+
 if __name__ == "__main__":
-    with open(FILE_PATH, "r") as file:
-        strategy = [line.strip().split() for line in file.readlines()]
+    with open(FILE_PATH, "rb") as file:
+        data = file.read()
 
-    print(f"Part 1: {compute_total_score(strategy, 'move')}")
-    print(f"Part 2: {compute_total_score(strategy, 'result')}")
+    print(f"Part 1: {score_batch(data, 'move')}")
+    print(f"Part 2: {score_batch(data, 'result')}")
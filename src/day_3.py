@@ -1,8 +1,10 @@
 """Advent of Code - Day 3."""
 
 import string
+from functools import reduce
+from operator import or_
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_3.txt"
 
@@ -10,6 +12,10 @@ priority_lookup = {
     letter: priority + 1 for priority, letter in enumerate(string.ascii_letters)
 }
 
+bit_lookup = {
+    letter: 1 << (priority - 1) for letter, priority in priority_lookup.items()
+}
+
 
 def sum_compartment_priorities(rucksacks: List) -> int:
     """Compartment priorities.
@@ -62,9 +68,82 @@ def sum_group_priorities(rucksacks: List) -> int:
     return badge_priority_sum
 
 
+def encode_items(items: str) -> int:
+    """Item bitmask.
+
+    Encode items as a 52-bit integer with bit (priority - 1) set for each item
+    type in the string.
+
+    Args:
+        items: Items of a rucksack or compartment.
+
+    Returns:
+        int: Bitmask of item types.
+    """
+    return reduce(or_, map(bit_lookup.__getitem__, items), 0)
+
+
+def sum_compartment_priorities_bitmask(rucksacks: Iterable[str]) -> int:
+    """Compartment priorities with bitmasks.
+
+    Same as sum_compartment_priorities, but the compartments are intersected as
+    bitmasks. The priority of the shared item is the bit length of the result.
+
+    Args:
+        rucksacks: Iterable with puzzle input, e.g. an open file object.
+
+    Returns:
+        int: Sum of priorities by compartment item.
+
+    Raises:
+        ValueError: If the compartments of a rucksack share no item.
+    """
+    priority_sum = 0
+    for rucksack in rucksacks:
+        rucksack = rucksack.strip()
+        split = len(rucksack) // 2
+        common = encode_items(rucksack[:split]) & encode_items(rucksack[split:])
+        if common == 0:
+            raise ValueError(f"No shared item in rucksack {rucksack!r}")
+        priority_sum += common.bit_length()
+
+    return priority_sum
+
+
+def sum_group_priorities_bitmask(rucksacks: Iterable[str], group_size: int = 3) -> int:
+    """Badge priorities with bitmasks.
+
+    Stream over the rucksacks and intersect the bitmasks of each group of
+    group_size consecutive elves. Blank lines are skipped and an incomplete
+    trailing group is ignored.
+
+    Args:
+        rucksacks: Iterable with puzzle input, e.g. an open file object.
+        group_size: Number of elves per group.
+
+    Returns:
+        int: Sum of badge priorites.
+
+    Raises:
+        ValueError: If the rucksacks of a group share no item.
+    """
+    badge_priority_sum = 0
+    common = -1
+    items = (rucksack.strip() for rucksack in rucksacks)
+    for i, rucksack in enumerate(filter(None, items), 1):
+        common &= encode_items(rucksack)
+        if i % group_size == 0:
+            if common == 0:
+                raise ValueError(f"No shared item in group ending at {rucksack!r}")
+            badge_priority_sum += common.bit_length()
+            common = -1
+
+    return badge_priority_sum
+
+
 if __name__ == "__main__":
     with open(FILE_PATH, "r") as file:
         rucksacks = [line.strip() for line in file.readlines()]
 
-    print(f"Part 1: {sum_compartment_priorities(rucksacks)}.")
-    print(f"Part 2: {sum_group_priorities(rucksacks)}.")
+    print(f"Part 1: {sum_compartment_priorities_bitmask(rucksacks)}.")
+    print(f"Part 2: {sum_group_priorities_bitmask(rucksacks)}.")
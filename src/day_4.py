@@ -1,7 +1,9 @@
 """Advent of Code - Day 4."""
 
+from bisect import bisect_right
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_4.txt"
 
@@ -44,9 +46,158 @@ def sum_redundant_ranges(pairs: List, type: str) -> int:
     return sum_pairs
 
 
+def parse_pair(pair: List) -> Tuple[int, int, int, int]:
+    """Range limits.
+
+    Args:
+        pair: Range limits of a pair as strings, e.g. ['2-4', '6-8'].
+
+    Returns:
+        Tuple[int, int, int, int]: Start and end of the first and second range.
+    """
+    first, second = [x.split("-") for x in pair]
+    return int(first[0]), int(first[1]), int(second[0]), int(second[1])
+
+
+def sum_redundant_intervals(pairs: Iterable, type: str) -> int:
+    """Range overlap with interval arithmetic.
+
+    Same as sum_redundant_ranges, but containment and overlap are checked on
+    the range limits only, so the run time does not depend on the range width.
+
+    Args:
+        pairs: Iterable of range limits for each pair.
+        type: 'fully' to sum up fully contained ranges only, else any overlap counts.
+
+    Returns:
+        int: Total number of ranges that are fully contained / overlapping dependending on type.
+    """
+    sum_pairs = 0
+
+    for pair in pairs:
+        a, b, c, d = parse_pair(pair)
+        if type == "fully":
+            sum_pairs += (a <= c and d <= b) or (c <= a and b <= d)
+        else:
+            sum_pairs += a <= d and c <= b
+
+    return sum_pairs
+
+
+def count_redundant_intervals_numpy(assignments: str) -> Tuple[int, int]:
+    """Vectorized range overlap.
+
+    Parse all range limits into four integer arrays and count fully contained
+    and overlapping pairs in one pass.
+
+    Args:
+        assignments: Raw puzzle input.
+
+    Returns:
+        Tuple[int, int]: Number of fully contained and overlapping pairs.
+    """
+    import numpy as np
+
+    limits = assignments.replace(",", " ").replace("-", " ").split()
+    endpoints: Any = np.array(limits, dtype=np.int64).reshape(-1, 4).T
+    a, b, c, d = endpoints
+    fully = ((a <= c) & (d <= b)) | ((c <= a) & (b <= d))
+    overlap = (a <= d) & (c <= b)
+    return int(fully.sum()), int(overlap.sum())
+
+
+def coverage_runs(pairs: Iterable) -> List[Tuple[int, int, int]]:
+    """Coverage histogram.
+
+    Sweep over the start and end events of all assignments to count how many
+    elves cover each section. Sections are grouped in runs with a constant
+    count, so the result only depends on the number of pairs and not on the
+    range width. Sections no elf is assigned to are left out.
+
+    Args:
+        pairs: Iterable of range limits for each pair.
+
+    Returns:
+        List[Tuple[int, int, int]]: Runs of (start, end, count), end inclusive.
+    """
+    deltas: Dict[int, int] = defaultdict(int)
+    for pair in pairs:
+        a, b, c, d = parse_pair(pair)
+        for start, end in ((a, b), (c, d)):
+            deltas[start] += 1
+            deltas[end + 1] -= 1
+
+    runs: List[Tuple[int, int, int]] = []
+    count = 0
+    # positions where starts and ends cancel out don't change the count
+    positions = sorted(pos for pos, delta in deltas.items() if delta != 0)
+    for pos, next_pos in zip(positions, positions[1:]):
+        count += deltas[pos]
+        if count > 0:
+            runs.append((pos, next_pos - 1, count))
+
+    return runs
+
+
+def coverage_at(runs: List[Tuple[int, int, int]], section: int) -> int:
+    """Coverage of a section.
+
+    Args:
+        runs: Coverage histogram from coverage_runs.
+        section: Section number.
+
+    Returns:
+        int: Number of elves assigned to the section.
+    """
+    i = bisect_right(runs, section, key=lambda run: run[0]) - 1
+    if i >= 0 and runs[i][1] >= section:
+        return runs[i][2]
+
+    return 0
+
+
+def over_assigned_sections(
+    runs: List[Tuple[int, int, int]], k: int
+) -> List[Tuple[int, int]]:
+    """Over-assigned sections.
+
+    Args:
+        runs: Coverage histogram from coverage_runs.
+        k: Maximum number of elves per section.
+
+    Returns:
+        List[Tuple[int, int]]: Ranges of sections covered by more than k elves.
+    """
+    sections: List[Tuple[int, int]] = []
+    for start, end, count in runs:
+        if count <= k:
+            continue
+        if sections and sections[-1][1] == start - 1:
+            sections[-1] = (sections[-1][0], end)
+        else:
+            sections.append((start, end))
+
+    return sections
+
+
+def total_overlap(runs: List[Tuple[int, int, int]]) -> int:
+    """Total overlap.
+
+    Number of section assignments that duplicate another elf's assignment,
+    i.e. each section covered by c elves contributes c - 1.
+
+    Args:
+        runs: Coverage histogram from coverage_runs.
+
+    Returns:
+        int: Total overlap across all assignments.
+    """
+    return sum((end - start + 1) * (count - 1) for start, end, count in runs)
+
+
 if __name__ == "__main__":
     with open(FILE_PATH, "r") as file:
         pairs = [line.strip().split(",") for line in file.readlines()]
 
-    print(f"Part 1: {sum_redundant_ranges(pairs, type='fully')}.")
-    print(f"Part 2: {sum_redundant_ranges(pairs, type='overlap')}.")
+    print(f"Part 1: {sum_redundant_intervals(pairs, type='fully')}.")
+    print(f"Part 2: {sum_redundant_intervals(pairs, type='overlap')}.")
@@ -1,8 +1,9 @@
 """Advent of Code - Day 5."""
 import re
+from array import array
 from collections import deque
 from pathlib import Path
-from typing import Deque, Dict, List
+from typing import Deque, Dict, Iterator, List
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_5.txt"
 
@@ -43,10 +44,116 @@ def arrange_crates(crates: List, procedure: List, is_new_version: bool) -> str:
     return "".join([stack.pop() for stack in stacks.values()])
 
 
+def parse_stacks(crates: List) -> List[List[str]]:
+    """Stack drawing.
+
+    Read the crates column by column at the positions of the stack labels.
+    Rows must keep their leading whitespace.
+
+    Args:
+        crates: List of crates, last row with the stack labels.
+
+    Returns:
+        List[List[str]]: Stacks from bottom to top.
+    """
+    index = crates[-1]
+    columns = [pos for pos, label in enumerate(index) if label.strip()]
+    stacks: List[List[str]] = [[] for _ in columns]
+
+    for row in reversed(crates[:-1]):
+        for stack, pos in zip(stacks, columns):
+            if pos < len(row) and row[pos].strip():
+                stack.append(row[pos])
+
+    return stacks
+
+
+def parse_procedure(procedure: List) -> array:
+    """Procedure.
+
+    Parse all steps into a flat integer array of (n, from, to) triples with
+    zero-based stack indices.
+
+    Args:
+        procedure: List of steps for rearrangement.
+
+    Returns:
+        array: Flat array of step triples.
+
+    Raises:
+        ValueError: If a step does not contain exactly three numbers.
+    """
+    steps = array("l")
+    for line in procedure:
+        numbers = re.findall(r"\d+", line)
+        if len(numbers) != 3:
+            raise ValueError(f"Invalid step: {line!r}")
+        n, from_stack, to_stack = map(int, numbers)
+        steps.extend((n, from_stack - 1, to_stack - 1))
+
+    return steps
+
+
+def iter_arrangement(
+    stacks: List[List[str]], steps: array, is_new_version: bool
+) -> Iterator[List[List[str]]]:
+    """Step iterator.
+
+    Rearrange the stacks in place and yield them after every step. Each step
+    moves the whole block of n crates with slice operations. Copy the yielded
+    stacks to keep an intermediate snapshot.
+
+    Args:
+        stacks: Stacks from parse_stacks, modified in place.
+        steps: Step triples from parse_procedure.
+        is_new_version: Should the CrateMover 9001 be used?
+
+    Yields:
+        List[List[str]]: Stacks after each step.
+
+    Raises:
+        ValueError: If a step moves more crates than its source stack holds.
+    """
+    for i in range(0, len(steps), 3):
+        n, from_stack, to_stack = steps[i], stacks[steps[i + 1]], stacks[steps[i + 2]]
+        split = len(from_stack) - n
+        if split < 0:
+            raise ValueError(
+                f"Cannot move {n} crates from a stack of {len(from_stack)}"
+            )
+        block = from_stack[split:]
+        del from_stack[split:]
+        if not is_new_version:
+            block.reverse()
+        to_stack.extend(block)
+        yield stacks
+
+
+def arrange_crates_fast(crates: List, procedure: List, is_new_version: bool) -> str:
+    """Supply stacks with block moves.
+
+    Same as arrange_crates, but with the procedure parsed once and each step
+    moving its crates as one block.
+
+    Args:
+        crates: List of crates, rows with leading whitespace.
+        procedure: List of steps for rearrangement.
+        is_new_version: Should the CrateMover 9001 be used?
+
+    Returns:
+        str: Crates on top of each stack.
+    """
+    stacks = parse_stacks(crates)
+    for _ in iter_arrangement(stacks, parse_procedure(procedure), is_new_version):
+        pass
+
+    return "".join([stack[-1] for stack in stacks if stack])
+
+
 if __name__ == "__main__":
     with open(FILE_PATH, "r") as file:
-        lines = [line.strip() for line in file.readlines()]
+        lines = [line.rstrip("\n") for line in file.readlines()]
     [split] = [i for i, line in enumerate(lines) if line == ""]
     crates, procedure = lines[:split], lines[(split + 1) :]
-    print(f"Part 1: {arrange_crates(crates, procedure, is_new_version=False)}.")
-    print(f"Part 2: {arrange_crates(crates, procedure, is_new_version=True)}.")
+    print(f"Part 1: {arrange_crates_fast(crates, procedure, is_new_version=False)}.")
+    print(f"Part 2: {arrange_crates_fast(crates, procedure, is_new_version=True)}.")
@@ -1,5 +1,8 @@
 """Advent of Code - Day 6."""
+import mmap
+from collections import defaultdict
 from pathlib import Path
+from typing import Dict, Iterable, Iterator
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_6.txt"
 
@@ -25,8 +28,108 @@ def detect_start_of_packet(stream: str, n: int) -> int:
     return -1
 
 
+def _iter_chunks(stream: object, chunk_size: int) -> Iterator:
+    """Chunks.
+
+    Args:
+        stream: str, bytes, mmap or file object with a read method.
+        chunk_size: Number of characters / bytes per chunk.
+
+    Yields:
+        str | bytes: Consecutive chunks of the stream.
+    """
+    if hasattr(stream, "read") and not isinstance(stream, mmap.mmap):
+        while chunk := stream.read(chunk_size):
+            yield chunk
+    else:
+        for start in range(0, len(stream), chunk_size):  # type: ignore
+            yield stream[start : (start + chunk_size)]  # type: ignore
+
+
+class _Window:
+    """Sliding window of n characters with incremental duplicate tracking."""
+
+    __slots__ = ("n", "pos", "ring", "counts", "duplicates")
+
+    def __init__(self, n: int):
+        """Initialize window.
+
+        Args:
+            n: Window size.
+        """
+        self.n = n
+        self.pos = 0
+        self.ring: list = [None] * n
+        self.counts: Dict = defaultdict(int)
+        self.duplicates = 0
+
+    def push(self, char: object) -> bool:
+        """Slide the window by one character.
+
+        Args:
+            char: Next character of the stream.
+
+        Returns:
+            bool: True if the window holds n distinct characters.
+        """
+        counts = self.counts
+        slot = self.pos % self.n
+        self.pos += 1
+        if self.pos > self.n:
+            out = self.ring[slot]
+            counts[out] -= 1
+            if counts[out] == 1:
+                self.duplicates -= 1
+        self.ring[slot] = char
+        counts[char] += 1
+        if counts[char] == 2:
+            self.duplicates += 1
+
+        return self.pos >= self.n and self.duplicates == 0
+
+
+def detect_markers(
+    stream: object, ns: Iterable[int], chunk_size: int = 1 << 16
+) -> Dict[int, int]:
+    """Start-of-packet and start-of-message.
+
+    Slide a window of size n over the stream for every n at once. Each window
+    keeps the counts of its characters and the number of characters that
+    occur more than once, both updated incrementally, so the stream is read
+    once and never loaded as a whole.
+
+    Args:
+        stream: Device datastream as str, bytes, mmap or file object.
+        ns: Numbers of distinct characters.
+        chunk_size: Number of characters / bytes read at once.
+
+    Returns:
+        Dict[int, int]: Number of characters before the first marker for each
+            n, -1 if there is none.
+    """
+    markers = {n: -1 for n in ns}
+    windows = [_Window(n) for n in markers if n > 0]
+
+    pos = 0
+    for chunk in _iter_chunks(stream, chunk_size):
+        for char in chunk:
+            pos += 1
+            found = False
+            for window in windows:
+                if window.push(char):
+                    markers[window.n] = pos
+                    found = True
+            if found:
+                windows = [window for window in windows if markers[window.n] == -1]
+                if not windows:
+                    return markers
+
+    return markers
+
+
 if __name__ == "__main__":
-    with open(FILE_PATH, "r") as file:
-        stream = file.read().strip()
-    print(f"Part 1: {detect_start_of_packet(stream, n=4)}.")
-    print(f"Part 2: {detect_start_of_packet(stream, n=14)}.")
+    with open(FILE_PATH, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as stream:
+            markers = detect_markers(stream, ns=[4, 14])
+    print(f"Part 1: {markers[4]}.")
+    print(f"Part 2: {markers[14]}.")
@@ -1,8 +1,12 @@
 """Advent of Code - Day 7."""
 
+import heapq
 import re
+from bisect import bisect_left, bisect_right
 from copy import deepcopy
+from itertools import accumulate
 from pathlib import Path
+from typing import Iterable
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_7.txt"
 
@@ -79,13 +83,177 @@ def compute_sizes(tree: dict, jump_list: list) -> dict:
     return sizes
 
 
+def aggregate_sizes(
+    terminal_output: Iterable[str], parents: dict | None = None
+) -> dict:
+    """Directory sizes in one pass.
+
+    Keep a stack of open directories with the size collected since each was
+    entered. Leaving a directory adds its collected size to its total and to
+    the parent on the stack, so every line is handled in constant time.
+
+    Args:
+        terminal_output: Puzzle input split by line, e.g. an open file object.
+        parents: Optional dict that is filled with the parent path of each
+                 directory (None for the root).
+
+    Returns:
+        dict: Size of each directory, keys as in compute_sizes.
+    """
+    sizes: dict[str, int] = {}
+    stack: list[list] = []  # [path, size collected since cd]
+
+    def _leave() -> None:
+        path, size = stack.pop()
+        sizes[path] += size
+        if stack:
+            stack[-1][1] += size
+
+    for line in terminal_output:
+        line = line.strip()
+        if line == "$ cd ..":
+            _leave()
+        elif line.startswith("$ cd"):
+            dir_name = line.removeprefix("$ cd").strip()
+            if dir_name == "/":
+                while stack:
+                    _leave()
+            parent = stack[-1][0] if stack else None
+            path = dir_name if parent is None else f"{parent} {dir_name}"
+            sizes.setdefault(path, 0)
+            if parents is not None:
+                parents[path] = parent
+            stack.append([path, 0])
+        elif line[:1].isdigit():
+            stack[-1][1] += int(line.split(maxsplit=1)[0])
+
+    while stack:
+        _leave()
+
+    return sizes
+
+
+class SizeIndex:
+    """Threshold and subtree queries over a snapshot of directory sizes."""
+
+    def __init__(self, sizes: dict):
+        """Initialize index.
+
+        Sort the sizes once and keep their prefix sums. For subtree queries the
+        directories are also kept in path order, where each subtree is a
+        contiguous range, with a sparse table for range maximum lookups.
+
+        Args:
+            sizes: Size of each directory, keys as in compute_sizes.
+        """
+        self.sorted_sizes = sorted(sizes.values())
+        self.prefix_sums = [0, *accumulate(self.sorted_sizes)]
+
+        self.paths = sorted(sizes)
+        self.path_sizes = [sizes[path] for path in self.paths]
+        # sparse[k][i]: index of the largest size in path_sizes[i : i + 2**k]
+        self.sparse = [list(range(len(self.paths)))]
+        width = 1
+        while 2 * width <= len(self.paths):
+            prev = self.sparse[-1]
+            self.sparse.append(
+                [
+                    self._argmax(prev[i], prev[i + width])
+                    for i in range(len(self.paths) - 2 * width + 1)
+                ]
+            )
+            width *= 2
+
+    def _argmax(self, i: int, j: int) -> int:
+        return i if self.path_sizes[i] >= self.path_sizes[j] else j
+
+    def _range_argmax(self, lo: int, hi: int) -> int:
+        k = (hi - lo).bit_length() - 1
+        return self._argmax(self.sparse[k][lo], self.sparse[k][hi - (1 << k)])
+
+    def sum_at_most(self, x: int) -> int:
+        """Total size of all directories with a size of at most x.
+
+        Args:
+            x: Size threshold.
+
+        Returns:
+            int: Sum of sizes.
+        """
+        return self.prefix_sums[bisect_right(self.sorted_sizes, x)]
+
+    def count_at_least(self, x: int) -> int:
+        """Number of directories with a size of at least x.
+
+        Args:
+            x: Size threshold.
+
+        Returns:
+            int: Number of directories.
+        """
+        return len(self.sorted_sizes) - bisect_left(self.sorted_sizes, x)
+
+    def smallest_at_least(self, x: int) -> int | None:
+        """Smallest directory size that is at least x.
+
+        Args:
+            x: Size threshold.
+
+        Returns:
+            int | None: Directory size, None if all directories are smaller.
+        """
+        i = bisect_left(self.sorted_sizes, x)
+        return self.sorted_sizes[i] if i < len(self.sorted_sizes) else None
+
+    def batch(self, thresholds: list[int]) -> list[tuple]:
+        """Batch of threshold queries.
+
+        Args:
+            thresholds: Size thresholds.
+
+        Returns:
+            list[tuple]: sum_at_most, count_at_least and smallest_at_least for
+                each threshold.
+        """
+        return [
+            (self.sum_at_most(x), self.count_at_least(x), self.smallest_at_least(x))
+            for x in thresholds
+        ]
+
+    def top_k_in_subtree(self, path: str, k: int) -> list[tuple[str, int]]:
+        """Largest directories in a subtree.
+
+        Args:
+            path: Path of the subtree root, keys as in compute_sizes. The root
+                  itself is part of the subtree.
+            k: Number of directories.
+
+        Returns:
+            list[tuple[str, int]]: Paths and sizes, largest first.
+        """
+        lo = bisect_left(self.paths, path)
+        hi = bisect_left(self.paths, path + "!")  # "!" follows the separator " "
+        candidates = []
+        if lo < hi:
+            i = self._range_argmax(lo, hi)
+            candidates.append((-self.path_sizes[i], i, lo, hi))
+
+        top: list[tuple[str, int]] = []
+        while candidates and len(top) < k:
+            _, i, lo, hi = heapq.heappop(candidates)
+            top.append((self.paths[i], self.path_sizes[i]))
+            for sub_lo, sub_hi in ((lo, i), (i + 1, hi)):
+                if sub_lo < sub_hi:
+                    j = self._range_argmax(sub_lo, sub_hi)
+                    heapq.heappush(candidates, (-self.path_sizes[j], j, sub_lo, sub_hi))
+
+        return top
+
+
 if __name__ == "__main__":
     with open(FILE_PATH, "r") as file:
-        terminal_output = [line.strip() for line in file.readlines()]
-    tree, jump_list = construct_tree(terminal_output)
-    sizes = compute_sizes(tree, jump_list)
-    small_dirs = [size for _, size in sizes.items() if size < 100000]
+        sizes = aggregate_sizes(file)
+    index = SizeIndex(sizes)
     required_space = 30000000 - (70000000 - sizes["/"])
-    available_dirs = [size for _, size in sizes.items() if size >= required_space]
-    print(f"Part 1: {sum(small_dirs)}")
-    print(f"Part 2: {min(available_dirs)}")
+    print(f"Part 1: {index.sum_at_most(100000 - 1)}")
+    print(f"Part 2: {index.smallest_at_least(required_space)}")
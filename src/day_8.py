@@ -1,6 +1,13 @@
 """Advent of Code - Day 8."""
 
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import mul
 from pathlib import Path
+from typing import Any, Sequence
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_8.txt"
 
@@ -112,9 +119,503 @@ def find_max_scenic_score(trees: list) -> int:
     return max(scenic_scores)
 
 
+def count_trees_sweeps(trees: list) -> int:
+    """Count trees with running maxima.
+
+    Sweep every row from the left and right and every column from the top and
+    bottom with the running maximum of the trees passed so far. A tree is
+    visible if it is taller than the running maximum in any direction.
+
+    Args:
+        trees: List of tree heights.
+
+    Returns:
+        int: Number of visible trees.
+    """
+    n_rows = len(trees)
+    n_cols = len(trees[0])
+    visible = [[False] * n_cols for _ in range(n_rows)]
+
+    for i, row in enumerate(trees):
+        for cols in (range(n_cols), range(n_cols - 1, -1, -1)):
+            highest = -1
+            for j in cols:
+                if row[j] > highest:
+                    visible[i][j] = True
+                    highest = row[j]
+
+    for j in range(n_cols):
+        for rows in (range(n_rows), range(n_rows - 1, -1, -1)):
+            highest = -1
+            for i in rows:
+                if trees[i][j] > highest:
+                    visible[i][j] = True
+                    highest = trees[i][j]
+
+    return sum(sum(row) for row in visible)
+
+
+def count_trees_numpy(trees: list) -> int:
+    """Count trees with vectorized running maxima.
+
+    Same as count_trees_sweeps on a uint8 grid with np.maximum.accumulate.
+
+    Args:
+        trees: List of tree heights or a 2D array.
+
+    Returns:
+        int: Number of visible trees.
+    """
+    import numpy as np
+
+    grid = np.asarray(trees, dtype=np.uint8)
+    visible = np.zeros(grid.shape, dtype=bool)
+
+    for k in range(4):
+        # view of the grid with the sweep direction along the rows from the left
+        view: Any = np.rot90(grid, k)
+        seen: Any = np.rot90(visible, k)
+        highest = np.maximum.accumulate(view, axis=1)
+        seen[:, 0] = True
+        seen[:, 1:] |= view[:, 1:] > highest[:, :-1]
+
+    return int(visible.sum())
+
+
+def _viewing_distances(tree_line: Sequence[int]) -> tuple[list, list]:
+    """Viewing distances along a line.
+
+    Keep a stack of trees that are not yet blocked by a taller or equal tree,
+    so the nearest blocking tree is always on top after popping the smaller
+    ones.
+
+    Args:
+        tree_line: Heights of a row or column.
+
+    Returns:
+        tuple[list, list]: Viewing distances backwards and forwards.
+    """
+    n = len(tree_line)
+    backward = [0] * n
+    forward = [0] * n
+
+    stack: list[int] = []
+    for k in range(n):
+        tree = tree_line[k]
+        while stack and tree_line[stack[-1]] < tree:
+            stack.pop()
+        backward[k] = k - stack[-1] if stack else k
+        stack.append(k)
+
+    stack = []
+    for k in range(n - 1, -1, -1):
+        tree = tree_line[k]
+        while stack and tree_line[stack[-1]] < tree:
+            stack.pop()
+        forward[k] = stack[-1] - k if stack else n - 1 - k
+        stack.append(k)
+
+    return backward, forward
+
+
+def scenic_score_grid(trees: list, as_numpy: bool = False) -> list | Any:
+    """Scenic score grid.
+
+    Compute the scenic score of every tree with one monotonic stack pass per
+    row and per column.
+
+    Args:
+        trees: List of tree heights.
+        as_numpy: Return a 2D uint64 NumPy array instead of arrays per row.
+
+    Returns:
+        list | np.ndarray: Scenic scores as a list of array('Q') rows or as a
+            NumPy array.
+    """
+    n_rows = len(trees)
+    n_cols = len(trees[0])
+
+    scores = []
+    for row in trees:
+        left, right = _viewing_distances(row)
+        scores.append(array("Q", map(mul, left, right)))
+
+    for j in range(n_cols):
+        top, bottom = _viewing_distances([trees[i][j] for i in range(n_rows)])
+        for i in range(n_rows):
+            scores[i][j] *= top[i] * bottom[i]
+
+    if as_numpy:
+        import numpy as np
+
+        return np.array(scores, dtype=np.uint64).reshape(n_rows, n_cols)
+
+    return scores
+
+
+def find_best_scenic_spot(trees: list) -> tuple[int, tuple[int, int]]:
+    """Best scenic spot.
+
+    Same as find_max_scenic_score in O(rows * cols), also returning the
+    position of the tree.
+
+    Args:
+        trees: List of tree heights.
+
+    Returns:
+        tuple[int, tuple[int, int]]: Maximum scenic score and its row and
+            column.
+    """
+    best, best_pos = -1, (0, 0)
+    for i, row in enumerate(scenic_score_grid(trees)):
+        j = max(range(len(row)), key=row.__getitem__)
+        if row[j] > best:
+            best, best_pos = row[j], (i, j)
+
+    return best, best_pos
+
+
+def _line_visibility(tree_line: Sequence[int]) -> list[bool]:
+    """Visibility along a line.
+
+    Args:
+        tree_line: Heights of a row or column.
+
+    Returns:
+        list[bool]: Whether each tree is visible from either end of the line.
+    """
+    n = len(tree_line)
+    visible = [False] * n
+    for positions in (range(n), range(n - 1, -1, -1)):
+        highest = -1
+        for k in positions:
+            if tree_line[k] > highest:
+                visible[k] = True
+                highest = tree_line[k]
+
+    return visible
+
+
+class Forest:
+    """Tree grid with incrementally maintained visibility and scenic scores.
+
+    Visibility and viewing distances are kept separately per row and per
+    column. Changing a tree only affects its row and column, so update costs
+    O(rows + cols). The best scenic score is kept in a heap whose outdated
+    entries are dropped lazily.
+    """
+
+    def __init__(self, trees: list):
+        """Initialize forest.
+
+        Args:
+            trees: List of tree heights.
+        """
+        self.trees = [list(row) for row in trees]
+        self.n_rows = len(trees)
+        self.n_cols = len(trees[0])
+
+        self.row_visible: list[list[bool]] = [[] for _ in range(self.n_rows)]
+        self.col_visible: list[list[bool]] = [[] for _ in range(self.n_cols)]
+        self.row_scores = [array("Q") for _ in range(self.n_rows)]
+        self.col_scores = [array("Q") for _ in range(self.n_cols)]
+        for i in range(self.n_rows):
+            self._update_row(i)
+        for j in range(self.n_cols):
+            self._update_col(j)
+
+        self.visible_count = sum(
+            self.is_visible(i, j)
+            for i in range(self.n_rows)
+            for j in range(self.n_cols)
+        )
+        self._rebuild_heap()
+
+    def _update_row(self, i: int) -> None:
+        row = self.trees[i]
+        self.row_visible[i] = _line_visibility(row)
+        left, right = _viewing_distances(row)
+        self.row_scores[i] = array("Q", map(mul, left, right))
+
+    def _update_col(self, j: int) -> None:
+        col = [row[j] for row in self.trees]
+        self.col_visible[j] = _line_visibility(col)
+        top, bottom = _viewing_distances(col)
+        self.col_scores[j] = array("Q", map(mul, top, bottom))
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [
+            (-self.scenic_score(i, j), i, j)
+            for i in range(self.n_rows)
+            for j in range(self.n_cols)
+        ]
+        heapq.heapify(self._heap)
+
+    def is_visible(self, i: int, j: int) -> bool:
+        """Check if a tree is visible from outside the grid.
+
+        Args:
+            i: Row number.
+            j: Column number.
+
+        Returns:
+            bool: Whether the tree is visible.
+        """
+        return self.row_visible[i][j] or self.col_visible[j][i]
+
+    def scenic_score(self, i: int, j: int) -> int:
+        """Scenic score of a tree.
+
+        Args:
+            i: Row number.
+            j: Column number.
+
+        Returns:
+            int: Scenic score.
+        """
+        return self.row_scores[i][j] * self.col_scores[j][i]
+
+    def update(self, i: int, j: int, height: int) -> None:
+        """Change the height of a tree.
+
+        Args:
+            i: Row number.
+            j: Column number.
+            height: New tree height.
+        """
+        cells = [(i, k) for k in range(self.n_cols)]
+        cells.extend((k, j) for k in range(self.n_rows) if k != i)
+
+        self.visible_count -= sum(self.is_visible(a, b) for a, b in cells)
+        self.trees[i][j] = height
+        self._update_row(i)
+        self._update_col(j)
+        self.visible_count += sum(self.is_visible(a, b) for a, b in cells)
+
+        if len(self._heap) + len(cells) > 4 * self.n_rows * self.n_cols:
+            self._rebuild_heap()
+        else:
+            for a, b in cells:
+                heapq.heappush(self._heap, (-self.scenic_score(a, b), a, b))
+
+    def best_scenic_spot(self) -> tuple[int, tuple[int, int]]:
+        """Best scenic spot.
+
+        Returns:
+            tuple[int, tuple[int, int]]: Maximum scenic score and its row and
+                column.
+        """
+        heap = self._heap
+        while -heap[0][0] != self.scenic_score(heap[0][1], heap[0][2]):
+            heapq.heappop(heap)
+        score, i, j = heap[0]
+
+        return -score, (i, j)
+
+
+def load_forest_mmap(path: Path | str) -> Any:
+    """Memory-mapped forest.
+
+    Map the digit file into memory and return a strided uint8 view that skips
+    the line breaks, so no tree is copied. The values are the ASCII codes of
+    the digits, which keep the order of the heights.
+
+    Args:
+        path: Path to the puzzle input.
+
+    Returns:
+        Any: Read-only uint8 np.ndarray view of shape (rows, cols).
+    """
+    import numpy as np
+
+    with open(path, "rb") as file:
+        first_line = file.readline()
+    n_cols = len(first_line.rstrip(b"\r\n"))
+    line_length = len(first_line)
+
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    n_rows = (raw.size + line_length - n_cols) // line_length
+    return np.lib.stride_tricks.as_strided(
+        raw, shape=(n_rows, n_cols), strides=(line_length, 1), writeable=False
+    )
+
+
+def _band_summary(path: Path | str, lo: int, hi: int) -> tuple:
+    """Band summary.
+
+    For each height level v and column, find the last and first row in the
+    band [lo, hi) with a tree of at least height v.
+
+    Args:
+        path: Path to the puzzle input.
+        lo: First row of the band.
+        hi: Row after the last row of the band.
+
+    Returns:
+        tuple: Last and first rows of shape (10, cols), -1 and the number of
+            rows if there is no such tree.
+    """
+    import numpy as np
+
+    grid = load_forest_mmap(path)
+    levels = np.arange(10, dtype=np.uint8)[:, None]
+    last = np.full((10, grid.shape[1]), -1, dtype=np.int32)
+    first = np.full((10, grid.shape[1]), grid.shape[0], dtype=np.int32)
+    for r in range(lo, hi):
+        last[levels <= (grid[r] - 48)] = r
+    for r in range(hi - 1, lo - 1, -1):
+        first[levels <= (grid[r] - 48)] = r
+
+    return last, first
+
+
+def _sweep(heights: Any, state: Any, offset: int, reverse: bool) -> Any:
+    """Nearest blocking trees along the first axis.
+
+    Args:
+        heights: Tree heights of shape (n, m) as uint8, swept along n.
+        state: Last (or first if reverse) position along n with a tree of at
+               least each height, shape (10, m). Updated in place, so it can be
+               carried over to the next block.
+        offset: Position of the first entry of heights along n.
+        reverse: Sweep from the end of the first axis.
+
+    Returns:
+        Any: int32 array with the position of the nearest tree of at least the
+            same height for each tree, taken from state if there is none in
+            the block.
+    """
+    import numpy as np
+
+    levels = np.arange(10, dtype=np.uint8)[:, None]
+    columns = np.arange(heights.shape[1])
+    blocking = np.empty(heights.shape, dtype=np.int32)
+    n = heights.shape[0]
+    for k in range(n - 1, -1, -1) if reverse else range(n):
+        blocking[k] = state[heights[k], columns]
+        state[levels <= heights[k]] = offset + k
+
+    return blocking
+
+
+def _band_result(
+    path: Path | str, lo: int, hi: int, above: Any, below: Any
+) -> tuple[int, int, tuple[int, int]]:
+    """Band result.
+
+    Visible trees and best scenic spot of the rows [lo, hi), using the band
+    summaries of the rows above and below for the vertical directions. The
+    band is processed in chunks of rows, so the working memory is bounded by
+    the chunk size: a first pass stores the state of the top sweep at the
+    start of every chunk, a second pass goes through the chunks bottom-up and
+    reduces visibility and scores chunk by chunk.
+
+    Args:
+        path: Path to the puzzle input.
+        lo: First row of the band.
+        hi: Row after the last row of the band.
+        above: Last rows with a tree of at least each height above the band.
+        below: First rows with a tree of at least each height below the band.
+
+    Returns:
+        tuple[int, int, tuple[int, int]]: Number of visible trees, maximum
+            scenic score and its row and column.
+    """
+    import numpy as np
+
+    grid = load_forest_mmap(path)
+    n_rows, n_cols = grid.shape
+    levels = np.arange(10, dtype=np.uint8)[:, None]
+    cols = np.arange(n_cols, dtype=np.int32)
+    chunk_rows = max(16, (1 << 18) // n_cols)
+    starts = list(range(lo, hi, chunk_rows))
+
+    top_states = []
+    state = above.astype(np.int32)
+    for start in starts:
+        top_states.append(state.copy())
+        for r in range(start, min(start + chunk_rows, hi)):
+            state[levels <= (grid[r] - 48)] = r
+
+    visible_count = 0
+    best, best_pos = -1, (lo, 0)
+    bottom_state = below.astype(np.int32)
+    for start, top_state in zip(reversed(starts), reversed(top_states)):
+        end = min(start + chunk_rows, hi)
+        heights = grid[start:end] - 48
+        rows = np.arange(start, end, dtype=np.int32)[:, None]
+
+        top = _sweep(heights, top_state, start, reverse=False)
+        bottom = _sweep(heights, bottom_state, start, reverse=True)
+        outside = np.full((10, end - start), -1, dtype=np.int32)
+        left = _sweep(heights.T, outside, 0, reverse=False).T
+        outside.fill(n_cols)
+        right = _sweep(heights.T, outside, 0, reverse=True).T
+
+        visible = (top == -1) | (bottom == n_rows) | (left == -1) | (right == n_cols)
+        visible_count += int(visible.sum())
+        scores = (rows - np.maximum(top, 0)).astype(np.int64)
+        scores *= np.minimum(bottom, n_rows - 1) - rows
+        scores *= cols - np.maximum(left, 0)
+        scores *= np.minimum(right, n_cols - 1) - cols
+        i, j = np.unravel_index(int(np.argmax(scores)), scores.shape)
+        if scores[i, j] >= best:
+            best, best_pos = int(scores[i, j]), (start + int(i), int(j))
+
+    return visible_count, best, best_pos
+
+
+def analyze_forest_parallel(
+    path: Path | str, n_bands: int | None = None, max_workers: int | None = None
+) -> tuple[int, tuple[int, tuple[int, int]]]:
+    """Parallel forest analysis.
+
+    Split the memory-mapped grid into row bands processed by a process pool.
+    A first pass summarizes each band per column and height level, which is
+    enough to carry the vertical directions across band borders. A second pass
+    computes visibility and scenic scores per band. Every worker maps the file
+    itself, so only the small summaries are sent between processes.
+
+    Args:
+        path: Path to the puzzle input.
+        n_bands: Number of row bands, by default four per worker.
+        max_workers: Number of worker processes.
+
+    Returns:
+        tuple[int, tuple[int, tuple[int, int]]]: Number of visible trees and
+            the maximum scenic score with its row and column.
+    """
+    import numpy as np
+
+    n_rows, n_cols = load_forest_mmap(path).shape
+    if n_bands is None:
+        n_bands = 4 * (max_workers or os.cpu_count() or 1)
+    n = max(1, min(n_bands, n_rows))
+    limits = [n_rows * b // n for b in range(n + 1)]
+    los, his = limits[:-1], limits[1:]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        summaries = list(pool.map(_band_summary, repeat(path), los, his))
+
+        above = [np.full((10, n_cols), -1, dtype=np.int32)]
+        for last, _ in summaries[:-1]:
+            above.append(np.maximum(above[-1], last))
+        below = [np.full((10, n_cols), n_rows, dtype=np.int32)]
+        for _, first in reversed(summaries[1:]):
+            below.append(np.minimum(below[-1], first))
+        below.reverse()
+
+        results = list(pool.map(_band_result, repeat(path), los, his, above, below))
+
+    visible_count = sum(visible for visible, _, _ in results)
+    _, best, best_pos = max(results, key=lambda result: result[1])
+
+    return visible_count, (best, best_pos)
+
+
 if __name__ == "__main__":
     with open(FILE_PATH, "r") as file:
         lines = [list(line.strip()) for line in file.readlines()]
     trees = [[int(tree) for tree in line] for line in lines]
-    print(f"Part 1: {count_trees(trees)}.")
-    print(f"Part 2: {find_max_scenic_score(trees)}.")
+    print(f"Part 1: {count_trees_sweeps(trees)}.")
+    print(f"Part 2: {find_best_scenic_spot(trees)[0]}.")
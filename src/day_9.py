@@ -1,5 +1,8 @@
 """Advent of Code - Day 9."""
 
+import math
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from pathlib import Path
 
 FILE_PATH = Path(__file__).parent.parent / "data" / "day_9.txt"
@@ -69,9 +72,259 @@ def simulate(moves: list, n: int) -> list:
     return positions
 
 
+DIRECTIONS = {"U": (1, 0), "D": (-1, 0), "R": (0, 1), "L": (0, -1)}
+
+
+def encode(x: int, y: int) -> int:
+    """Encode a position as a single integer.
+
+    Args:
+        x: First coordinate.
+        y: Second coordinate, |y| < 2**31.
+
+    Returns:
+        int: Encoded position.
+    """
+    return (x << 32) + y
+
+
+def decode(position: int) -> tuple[int, int]:
+    """Decode a position encoded with encode.
+
+    Args:
+        position: Encoded position.
+
+    Returns:
+        tuple[int, int]: First and second coordinate.
+    """
+    x = (position + (1 << 31)) >> 32
+    return x, position - (x << 32)
+
+
+def _is_straight(xs: list, ys: list, dx: int, dy: int) -> bool:
+    """Check if every knot is one step behind the knot in front.
+
+    Args:
+        xs: First coordinates of the knots.
+        ys: Second coordinates of the knots.
+        dx: First coordinate of the move direction.
+        dy: Second coordinate of the move direction.
+
+    Returns:
+        bool: Whether the rope is straight along the move direction.
+    """
+    return all(
+        xs[i - 1] - xs[i] == dx and ys[i - 1] - ys[i] == dy for i in range(1, len(xs))
+    )
+
+
+class VisitedCells:
+    """Visited cells stored as single positions and straight runs.
+
+    Single positions are kept encoded in a set. Runs are kept as intervals per
+    row and per column, so a long straight move is stored in constant space.
+    Overlaps are only resolved when the cells are counted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with the start position."""
+        self.positions = {encode(0, 0)}
+        self.row_runs: dict[int, list[tuple[int, int]]] = defaultdict(list)
+        self.col_runs: dict[int, list[tuple[int, int]]] = defaultdict(list)
+
+    def add(self, x: int, y: int) -> None:
+        """Add a single position.
+
+        Args:
+            x: First coordinate.
+            y: Second coordinate.
+        """
+        self.positions.add(encode(x, y))
+
+    def add_run(self, x: int, y: int, dx: int, dy: int, steps: int) -> None:
+        """Add a straight run.
+
+        Args:
+            x: First coordinate of the start.
+            y: Second coordinate of the start.
+            dx: First coordinate of the direction.
+            dy: Second coordinate of the direction.
+            steps: Number of steps after the start.
+        """
+        if dx == 0:
+            ends = sorted((y, y + steps * dy))
+            self.row_runs[x].append((ends[0], ends[1]))
+        else:
+            ends = sorted((x, x + steps * dx))
+            self.col_runs[y].append((ends[0], ends[1]))
+
+    def __len__(self) -> int:
+        """Number of distinct visited cells.
+
+        Merge the runs of every row and column, subtract the cells where a row
+        run crosses a column run and add the single positions not covered by
+        any run.
+
+        Returns:
+            int: Number of cells.
+        """
+        rows = {x: _merge(runs) for x, runs in self.row_runs.items()}
+        cols = {y: _merge(runs) for y, runs in self.col_runs.items()}
+
+        count = sum(hi - lo + 1 for runs in rows.values() for lo, hi in runs)
+        count += sum(hi - lo + 1 for runs in cols.values() for lo, hi in runs)
+        count -= _count_crossings(rows, cols)
+        for position in self.positions:
+            x, y = decode(position)
+            if not (_covers(rows.get(x, []), y) or _covers(cols.get(y, []), x)):
+                count += 1
+
+        return count
+
+
+def _merge(runs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or adjacent intervals.
+
+    Args:
+        runs: Inclusive intervals.
+
+    Returns:
+        list[tuple[int, int]]: Sorted disjoint intervals.
+    """
+    merged: list[tuple[int, int]] = []
+    for lo, hi in sorted(runs):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+
+    return merged
+
+
+def _covers(runs: list[tuple[int, int]], value: int) -> bool:
+    """Check if sorted disjoint intervals contain a value.
+
+    Args:
+        runs: Sorted disjoint inclusive intervals.
+        value: Value to look up.
+
+    Returns:
+        bool: Whether an interval contains the value.
+    """
+    i = bisect_right(runs, (value, math.inf)) - 1
+    return i >= 0 and runs[i][1] >= value
+
+
+def _count_crossings(
+    rows: dict[int, list[tuple[int, int]]], cols: dict[int, list[tuple[int, int]]]
+) -> int:
+    """Number of cells covered by both a row run and a column run.
+
+    Sweep over the first coordinate and keep the columns with an open run in a
+    Fenwick tree, so each row run is a range count.
+
+    Args:
+        rows: Merged runs per row.
+        cols: Merged runs per column.
+
+    Returns:
+        int: Number of crossing cells.
+    """
+    ys = sorted(cols)
+    tree = [0] * (len(ys) + 1)
+
+    def _update(k: int, delta: int) -> None:
+        k += 1
+        while k <= len(ys):
+            tree[k] += delta
+            k += k & -k
+
+    def _prefix(k: int) -> int:
+        total = 0
+        while k > 0:
+            total += tree[k]
+            k -= k & -k
+        return total
+
+    # (x, 0, column index, delta) updates before (x, 1, lo, hi) queries
+    events = []
+    for k, y in enumerate(ys):
+        for lo, hi in cols[y]:
+            events.append((lo, 0, k, 1))
+            events.append((hi + 1, 0, k, -1))
+    for x, runs in rows.items():
+        for lo, hi in runs:
+            events.append((x, 1, lo, hi))
+    events.sort()
+
+    crossings = 0
+    for _, kind, a, b in events:
+        if kind == 0:
+            _update(a, b)
+        else:
+            crossings += _prefix(bisect_right(ys, b)) - _prefix(bisect_left(ys, a))
+
+    return crossings
+
+
+def simulate_visited(
+    moves: list, n: int, track: tuple[int, ...] = (-1,)
+) -> dict[int, VisitedCells]:
+    """Compact simulation.
+
+    Simulate rope movements with n knots, where each knot steps by the sign of
+    its distance to the knot in front. Only the positions of the tracked knots
+    are recorded. Once the rope is straight along a move, the rest of the
+    move is done at once and stored as a run, so the run time depends on the
+    number of moves rather than the distance covered.
+
+    Args:
+        moves: List of puzzle input. Each item is a tuple where the first item
+            indicates the direciton and the second item the step size.
+        n: Number of knots.
+        track: Indices of the knots to track, negative indices count from the
+               tail.
+
+    Returns:
+        dict[int, VisitedCells]: Visited cells for each tracked index.
+    """
+    xs = [0] * n
+    ys = [0] * n
+    visited = {k: VisitedCells() for k in track}
+    tracked = [(k % n, visited[k]) for k in track]
+
+    for move, step in moves:
+        dx, dy = DIRECTIONS[move]
+        for done in range(1, step + 1):
+            xs[0] += dx
+            ys[0] += dy
+            for i in range(1, n):
+                delta_x = xs[i - 1] - xs[i]
+                delta_y = ys[i - 1] - ys[i]
+                if -1 <= delta_x <= 1 and -1 <= delta_y <= 1:
+                    # knots further back can't move either
+                    break
+                xs[i] += (delta_x > 0) - (delta_x < 0)
+                ys[i] += (delta_y > 0) - (delta_y < 0)
+            else:
+                if done < step and _is_straight(xs, ys, dx, dy):
+                    # every knot moves one cell per remaining step
+                    remaining = step - done
+                    for i, cells in tracked:
+                        cells.add_run(xs[i], ys[i], dx, dy, remaining)
+                    for i in range(n):
+                        xs[i] += remaining * dx
+                        ys[i] += remaining * dy
+                    break
+            for i, cells in tracked:
+                cells.add(xs[i], ys[i])
+
+    return visited
+
+
 if __name__ == "__main__":
     with open(FILE_PATH, "r") as file:
         lines = [line.strip().split() for line in file.readlines()]
     moves = [(line[0], int(line[1])) for line in lines]
-    print(f"Part 1: {len(set(simulate(moves, n=2)[-1]))}.")
-    print(f"Part 2: {len(set(simulate(moves, n=10)[-1]))}.")
+    print(f"Part 1: {len(simulate_visited(moves, n=2)[-1])}.")
+    print(f"Part 2: {len(simulate_visited(moves, n=10)[-1])}.")